@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from jirosso.cli import cli
+
+__all__ = ['cli']
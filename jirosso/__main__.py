@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+from jirosso.cli import cli
+
+
+if __name__ == '__main__':
+    cli()
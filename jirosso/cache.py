@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import configparser
+import json
+import os
+import pickle
+import time
+import zipimport
+from functools import lru_cache
+
+
+SETTINGS_PATH = os.path.join(os.path.dirname(__file__), 'settings.ini')
+
+
+def cache_path(name):
+    """
+    Returns path to the file `name` in jirosso's cache directory
+    (`$XDG_CACHE_HOME/jirosso`, `~/.cache/jirosso` by default).
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'jirosso', name)
+
+
+def open_for_write(path, mode='w'):
+    """
+    Opens cache file `path` for writing, creating its directory if needed.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return open(path, mode)
+
+
+def parse_settings(text):
+    config = configparser.ConfigParser()
+    config.read_string(text)
+    return {name: dict(section) for name, section in config.items()}
+
+
+@lru_cache(None)
+def settings():
+    """
+    Returns `settings.ini` as a dict of sections.
+
+    Parsed result is pickled to the cache directory
+    and reused until the ini file is modified.
+    """
+    if isinstance(__loader__, zipimport.zipimporter):
+        # Running from a zipapp, settings.ini is inside the archive.
+        return parse_settings(__loader__.get_data(SETTINGS_PATH).decode('utf-8'))
+
+    key = (SETTINGS_PATH, os.stat(SETTINGS_PATH).st_mtime)
+
+    path = cache_path('settings.pkl')
+    try:
+        with open(path, 'rb') as fp:
+            cached_key, parsed = pickle.load(fp)
+        if cached_key == key:
+            return parsed
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        pass
+
+    with open(SETTINGS_PATH, encoding='utf-8') as fp:
+        parsed = parse_settings(fp.read())
+
+    try:
+        with open_for_write(path, 'wb') as fp:
+            pickle.dump((key, parsed), fp)
+    except OSError:
+        pass
+    return parsed
+
+
+@lru_cache(None)
+def issue_types():
+    return tuple(t.strip() for t in settings()['DEFAULT']['issue_types'].split(','))
+
+
+class MetaCache:
+    """
+    On-disk cache of JIRA metadata (projects list).
+
+    Cache is invalidated after `ttl` seconds or when
+    the JIRA server or username changes.
+    """
+    ttl = 24 * 60 * 60
+
+    def __init__(self, jira_server, username):
+        self.path = cache_path('meta.json')
+        self.fingerprint = {'server': jira_server, 'username': username}
+
+    def load(self):
+        if os.environ.get('JIROSSO_REFRESH') == '1':
+            return None
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+        if any(data.get(k) != v for k, v in self.fingerprint.items()):
+            return None
+        if data.get('ttl_expires', 0) < time.time():
+            return None
+        return data
+
+    def dump(self, **meta):
+        data = dict(self.fingerprint, ttl_expires=time.time() + self.ttl, **meta)
+        try:
+            with open_for_write(self.path) as fp:
+                json.dump(data, fp)
+        except OSError:
+            pass
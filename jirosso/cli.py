@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+import bisect
+import heapq
+import os
+import re
+import sys
+from functools import cached_property, lru_cache
+from itertools import islice, takewhile
+
+import click
+
+from jirosso.cache import issue_types
+from jirosso.client import JiraHelper, run_concurrently
+
+
+COMPLETION_LIMIT = 50
+
+ISSUE_RE = re.compile(r'\w+-\d+')
+BRANCH_ISSUE_RE = re.compile(r'[A-Z]+-\d+')
+
+# Precomputed ANSI sequences, same as `click.style` would produce.
+LINK_STYLE = '\x1b[34m\x1b[4m{0}\x1b[0m'
+TIME_STYLE = '\x1b[31m{0}\x1b[0m'
+
+
+class LazyChoice(click.Choice):
+    """
+    `click.Choice` which resolves its choices only when they are needed.
+
+    Choices are looked up in a dict instead of being
+    normalized and scanned on each validation.
+    """
+
+    def __init__(self, get_choices, case_sensitive=True):
+        self.get_choices = get_choices
+        self.case_sensitive = case_sensitive
+
+    @property
+    def choices(self):
+        return self.get_choices()
+
+    @cached_property
+    def normed_choices(self):
+        if self.case_sensitive:
+            return {c: c for c in self.choices}
+        return {c.lower(): c for c in self.choices}
+
+    def convert(self, value, param, ctx):
+        normed_value = value if self.case_sensitive else value.lower()
+        try:
+            return self.normed_choices[normed_value]
+        except KeyError:
+            return super().convert(value, param, ctx)
+
+
+pass_jira_helper = click.make_pass_decorator(JiraHelper)
+
+
+def make_jira_helper(ctx):
+    """
+    Creates `JiraHelper` configured from the root command options.
+    """
+    jira_helper = JiraHelper()
+    params = ctx.find_root().params
+    for option in ('jira_server', 'username', 'password'):
+        jira_helper.set_config(option, params.get(option))
+    return jira_helper
+
+
+@click.group()
+@click.option(
+    '--jira-server',
+    prompt=True,
+    envvar='JIRA_SERVER',
+    help='Your JIRA server host',
+)
+@click.option(
+    '--username',
+    prompt=True,
+    envvar='JIRA_USERNAME',
+    help='Your JIRA username. Example: a.opalev',
+)
+@click.password_option(
+    envvar='JIRA_PASSWORD',
+    help='Your JIRA password',
+)
+@click.version_option('1.0.0')
+@click.pass_context
+def cli(ctx, jira_server, username, password):
+    """
+    Jirosso is a command line tool for manipulating JIRA tasks.
+
+    Variables that can be used from environment:
+
+    \b
+      * JIRA_SERVER
+      * JIRA_USER
+      * JIRA_PASSWORD
+
+    Current list of commands:
+
+    \b
+      * `commit-time` -- Update task with its worklog
+      * `create-issue` -- Create new issue
+      * `refresh-cache` -- Refresh cached JIRA projects
+
+    ln -s /usr/local/bin/jirosso jirosso
+    """
+    ctx.obj = make_jira_helper(ctx)
+
+
+def prewarm_jira(ctx):
+    """
+    Starts opening JIRA session while the rest of the options are prompted.
+    """
+    if ctx.resilient_parsing:
+        return
+    if os.environ.get('JIROSSO_NO_PREWARM') != '1':
+        ctx.obj.prewarm()
+
+
+def prewarm_unless_dry_run(ctx, param, value):
+    # `create-issue --dry-run` exits without touching JIRA.
+    if not ctx.params.get('dry_run'):
+        prewarm_jira(ctx)
+    return value
+
+
+def validate_issue_num(ctx, param, value):
+    if not value:
+        return
+
+    if not ISSUE_RE.fullmatch(value):
+        raise click.BadParameter(
+            'Issue has to be in the `\\w+-\\d+` format.'
+        )
+    return value
+
+
+@lru_cache(None)
+def issue_from_branch():
+    """
+    Returns issue number embedded into the current git branch name, if any.
+    """
+    import subprocess
+
+    try:
+        branch = subprocess.check_output(
+            ['git', 'symbolic-ref', '--short', 'HEAD'],
+            stderr=subprocess.DEVNULL,
+        )
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+    match = BRANCH_ISSUE_RE.search(branch.decode('utf-8', 'replace'))
+    return match.group() if match else None
+
+
+def validate_issue_num_or_branch(ctx, param, value):
+    """
+    Falls back to the issue from the current branch name
+    and prompts only if there is none.
+    """
+    if not value and not ctx.resilient_parsing:
+        value = issue_from_branch() or click.prompt('Issue num')
+    return validate_issue_num(ctx, param, value)
+
+
+def is_valid_time(value):
+    """
+    Checks that `value` is in the `\\d+[mhdw]` format without using regex.
+    """
+    return len(value) > 1 and value[-1] in 'mhdw' and value[:-1].isdecimal()
+
+
+def validate_time(ctx, param, value):
+    if not value:
+        return
+
+    if not is_valid_time(value):
+        raise click.BadParameter(
+            'Time has to be in the `\\d+[mhdw]` format.'
+        )
+    # Time is given, so the issue is going to be fetched, even in dry run.
+    prewarm_jira(ctx)
+    return value
+
+
+@cli.command()
+@click.option(
+    '--issue-num',
+    callback=validate_issue_num_or_branch,
+    help='JIRA issue to update. Format: \\w+-\\d+. '
+         'Defaults to the issue in the current git branch name.',
+)
+@click.option(
+    '--time',
+    prompt=True,
+    default='',
+    callback=validate_time,
+    required=False,
+    help='Time spent on the task which will be committed to JIRA. '
+         'Format: \\d+[mhdw]. '
+         'If not provided, jirosso will skip time commitment.',
+)
+@click.option(
+    '--message',
+    prompt=True,
+    help='Comment message to the issue',
+)
+@click.option(
+    '--dry-run',
+    is_flag=True,
+    default=False,
+    help='Disable actual commit to JIRA',
+)
+@pass_jira_helper
+def commit_time(jira_helper, issue_num, time, message, dry_run):
+    """
+    Command to commit time to JIRA.
+
+    Best way to use `commit-time` command is to put
+    git_hooks/prepare-commit-msg into the project's .git/hooks directory.
+
+    Dont forget to evaluate
+    `chmod +x .git/hooks/prepare-commit-msg`
+    """
+    # If the time is something other than JIRA desired time format,
+    # we will skip time commitment at all.
+    if not time:
+        click.echo('Skipped time commit')
+        sys.exit(0)
+
+    jira_helper.set_config('issue', issue_num)
+
+    if dry_run:
+        click.echo('Running in dry run mode')
+    else:
+        # Resolve the issue once so that both calls share it.
+        jira_helper.fetch_issue()
+        run_concurrently(
+            (jira_helper.add_worklog, time, message),
+            (jira_helper.add_comment, message),
+        )
+
+    click.echo('Successfully committed time to JIRA')
+    click.echo('Issue: {0}'.format(LINK_STYLE.format(jira_helper.issue.permalink())))
+    click.echo('Time spent: {0}'.format(TIME_STYLE.format(time)))
+    sys.exit(0)
+
+
+@cli.command()
+@pass_jira_helper
+def refresh_cache(jira_helper):
+    """
+    Command to refresh cached JIRA metadata (projects list).
+
+    Cache can also be bypassed by setting JIROSSO_REFRESH=1.
+    """
+    projects = jira_helper.refresh_projects()
+    click.echo('Cached {0} projects'.format(len(projects)))
+
+
+def get_jira_projects(ctx, args, incomplete):
+    """
+    Completes project keys starting with `incomplete`,
+    falling back to the ones containing it.
+
+    Sorted projects are searched with bisect. Unsorted ones (fresh from JIRA)
+    are never fully sorted here, only the first `COMPLETION_LIMIT` matches are.
+    """
+    jira_helper = ctx.obj
+    if jira_helper is None:
+        # `cli` callback is not invoked during shell completion.
+        jira_helper = make_jira_helper(ctx)
+    config = jira_helper.config
+    if not all(config[option] for option in ('jira_server', 'username', 'password')):
+        return []
+
+    try:
+        projects = jira_helper.all_projects
+    except Exception:
+        # Tracebacks would end up in the user's shell.
+        return []
+    if jira_helper.projects_sorted:
+        start = bisect.bisect_left(projects, incomplete)
+        candidates = projects[start:start + COMPLETION_LIMIT]
+        matches = list(takewhile(lambda k: k.startswith(incomplete), candidates))
+        substring_matches = (k for k in projects if incomplete in k)
+        return matches or list(islice(substring_matches, COMPLETION_LIMIT))
+
+    matches = heapq.nsmallest(COMPLETION_LIMIT, (k for k in projects if k.startswith(incomplete)))
+    return matches or heapq.nsmallest(COMPLETION_LIMIT, (k for k in projects if incomplete in k))
+
+
+@cli.command()
+@click.option(
+    '--project',
+    prompt=True,
+    type=click.STRING,
+    callback=prewarm_unless_dry_run,
+    autocompletion=get_jira_projects,
+    help='JIRA project where issue will be created',
+)
+@click.option(
+    '--issuetype',
+    prompt=True,
+    type=LazyChoice(issue_types, case_sensitive=False),
+    help='Type of the issue.',
+)
+@click.option(
+    '--summary',
+    prompt=True,
+    help='Title of the issue',
+)
+@click.option(
+    '--description',
+    prompt=True,
+    help='Description of the issue',
+)
+@click.option(
+    '--message',
+    default="",
+    prompt=True,
+    help='Comment message to the issue',
+)
+@click.option(
+    '--issue-to-link',
+    callback=validate_issue_num,
+    prompt=True,
+    default='',
+    help='Issue that will be linked in the new issue',
+)
+@click.option(
+    '--rename-branch',
+    is_flag=True,
+    help='Rename current branch',
+)
+@click.option(
+    '--dry-run',
+    is_flag=True,
+    default=False,
+    is_eager=True,
+    help='Disable actual create of issue in JIRA.',
+)
+@click.pass_context
+def create_issue(ctx, project, issuetype, summary, description, message, issue_to_link, rename_branch, dry_run):
+    """
+    Command to create issue from a command line.
+    """
+    if dry_run:
+        click.echo('Running in dry run mode. Issue wont be created')
+        sys.exit(0)
+
+    jira_helper = ctx.obj
+
+    new_issue = jira_helper.create_issue(
+        project=project,
+        summary=summary,
+        description=description,
+        issuetype=issuetype.title(),
+        prefetch=True
+    )
+    jira_helper.set_config('issue', new_issue)
+
+    calls = [(jira_helper.assign_issue,)]
+    if message:
+        calls.append((jira_helper.add_comment, message))
+    if issue_to_link:
+        calls.append((jira_helper.create_issue_link, new_issue.key, issue_to_link))
+    run_concurrently(*calls)
+
+    click.echo('Successfully created a new issue in JIRA')
+    click.echo('Issue: {0}'.format(LINK_STYLE.format(new_issue.permalink())))
+
+    if rename_branch:
+        click.echo(new_issue.key)
+        # Renaming is the last step, so git replaces the current process.
+        sys.stdout.flush()
+        os.execvp('git', ['git', 'branch', '-m', new_issue.key])
+    sys.exit(0)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+import sys
+import threading
+from functools import cached_property, wraps
+
+import click
+
+from jirosso.cache import MetaCache, settings
+
+
+POOL_SIZE = 4
+
+# `jira` pulls in requests, oauthlib and friends, so it's imported lazily
+# to keep `--help` and shell completion fast.
+_jira_error = None
+
+
+def handle_jira_exception(f):
+    """
+    Handles `JIRAError` exceptions by
+    wrapping function with try except.
+
+    If exception occurs error will be showed in console.
+    """
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        global _jira_error
+        if _jira_error is None:
+            from jira.exceptions import JIRAError as _jira_error
+
+        try:
+            res = f(*args, **kwargs)
+        except _jira_error as e:
+            click.echo('Error: {0}'.format(e.text), err=True)
+            if e.response and e.response.text:
+                click.echo('Error: {0}'.format(e.response.text), err=True)
+            sys.exit(click.ClickException.exit_code)
+        else:
+            return res
+    return wrapper
+
+
+def run_concurrently(*calls):
+    """
+    Runs independent `(func, args...)` calls in a thread pool
+    and returns their results in order.
+
+    Exceptions (including `SystemExit` raised by `handle_jira_exception`)
+    are re-raised in the calling thread.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=POOL_SIZE) as executor:
+        futures = [executor.submit(call[0], *call[1:]) for call in calls]
+    return [future.result() for future in futures]
+
+
+class JiraHelper:
+
+    def __init__(self):
+        self.config = {
+            'timeout': float(settings()['DEFAULT'].get('timeout', 20.001)),
+            'jira_server': None,
+            'username': None,
+            'password': None,
+            'issue': None,
+        }
+        self._issue_cache = {}
+        self.projects_sorted = False
+        self._jira = None
+        self._jira_error = None
+        self._jira_lock = threading.Lock()
+
+    def set_config(self, key, value):
+        self.config[key] = value
+
+    @property
+    def jira(self):
+        # May be first accessed from the prewarm thread and
+        # the main thread at once, so only one of them connects.
+        # Failed connection is not retried, so that wrong credentials
+        # don't cost an extra failed login.
+        with self._jira_lock:
+            if self._jira is None:
+                if self._jira_error is not None:
+                    raise self._jira_error
+                try:
+                    self._jira = self.connect()
+                except Exception as e:
+                    self._jira_error = e
+                    raise
+            return self._jira
+
+    def connect(self):
+        from jira import JIRA
+
+        config = self.config
+        # The client's requests session keeps connections alive (pool of 10),
+        # so the connection opened for server info here is reused by later calls.
+        return JIRA(
+            server=config['jira_server'],
+            basic_auth=(
+                (
+                    config['username'],
+                    config['password'],
+                )
+            ),
+            timeout=config['timeout']
+        )
+
+    def prewarm(self):
+        """
+        Opens JIRA session in a background thread,
+        so that it is ready by the time user answers the prompts.
+
+        Errors are stored and raised on the actual use.
+        """
+        def warm():
+            try:
+                self.jira
+            except Exception:
+                pass
+
+        threading.Thread(target=warm, daemon=True).start()
+
+    @cached_property
+    def meta_cache(self):
+        return MetaCache(self.config['jira_server'], self.config['username'])
+
+    @cached_property
+    def all_projects(self):
+        """
+        Project keys. Sorted unless just fetched from JIRA,
+        they are cached sorted though.
+        """
+        meta = self.meta_cache.load()
+        if meta is not None:
+            self.projects_sorted = True
+            return meta['projects']
+
+        projects = self.fetch_projects()
+        self.meta_cache.dump(projects=sorted(projects))
+        return projects
+
+    @cached_property
+    def projects(self):
+        """
+        Sorted project keys.
+        """
+        projects = self.all_projects
+        return projects if self.projects_sorted else sorted(projects)
+
+    def fetch_projects(self):
+        """
+        Fetches project keys from JIRA.
+        """
+        return [p.key for p in self.jira.projects()]
+
+    @handle_jira_exception
+    def refresh_projects(self):
+        """
+        Fetches projects from JIRA and stores them sorted in the meta cache.
+        """
+        projects = sorted(self.fetch_projects())
+        self.meta_cache.dump(projects=projects)
+        self.all_projects = self.projects = projects
+        self.projects_sorted = True
+        return projects
+
+    @property
+    def issue(self):
+        """
+        Current issue, fetched once per issue key.
+        """
+        issue = self.config['issue']
+        key = getattr(issue, 'key', issue)
+        if key not in self._issue_cache:
+            self._issue_cache[key] = self.jira.issue(issue)
+        return self._issue_cache[key]
+
+    @handle_jira_exception
+    def fetch_issue(self):
+        """
+        Resolves current issue adding exception handler.
+        """
+        return self.issue
+
+    @handle_jira_exception
+    def add_worklog(self, time, message, **kwargs):
+        """
+        Proxies `add_worklog` to jira adding exception handler.
+        """
+        self.jira.add_worklog(self.issue, timeSpent=time, comment=message, **kwargs)
+
+    @handle_jira_exception
+    def add_comment(self, message, **kwargs):
+        """
+        Proxies `add_comment` to jira adding exception handler.
+        """
+        self.jira.add_comment(self.issue, body=message, **kwargs)
+
+    @handle_jira_exception
+    def create_issue_link(self, from_issue, to_issue):
+        """
+        Proxies `create_issue_link` to jira adding exception handler.
+
+        Issues are passed as plain keys, no need to fetch them first.
+        """
+        self.jira.create_issue_link('Relates', from_issue, to_issue)
+
+    @handle_jira_exception
+    def create_issue(self, **kwargs):
+        """
+        Proxies `create_issue` to jira adding exception handler.
+        """
+        return self.jira.create_issue(**kwargs)
+
+    @handle_jira_exception
+    def assign_issue(self):
+        return self.jira.assign_issue(self.issue, self.config['username'])
+
+    def __repr__(self):
+        return '<JiraHelper {!r}>'.format(self.config['jira_server'])
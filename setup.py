@@ -1,7 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import compileall
+import os
+import shutil
+import subprocess
+import sys
+import zipapp
 
-from setuptools import setup, find_packages
+from setuptools import Command, setup, find_packages
 
 with open('README.md') as readme_file:
     readme = readme_file.read()
@@ -12,19 +18,58 @@ setup_requirements = ['pytest-runner']
 test_requirements = ['pytest']
 
 
+class BuildZipapp(Command):
+    """
+    Builds `dist/jirosso.pyz`, a single-file zipapp with all
+    the dependencies and precompiled `.pyc` files.
+
+    Usage: python setup.py zipapp
+    """
+    description = 'build a self-contained jirosso.pyz zipapp'
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        build_dir = os.path.join('build', 'zipapp')
+        shutil.rmtree(build_dir, ignore_errors=True)
+        subprocess.check_call([
+            sys.executable, '-m', 'pip', 'install', '--target', build_dir, '.',
+        ])
+        # zipimport only picks up `.pyc` files placed next to the sources.
+        compileall.compile_dir(build_dir, quiet=1, legacy=True)
+
+        os.makedirs('dist', exist_ok=True)
+        zipapp.create_archive(
+            build_dir,
+            target=os.path.join('dist', 'jirosso.pyz'),
+            interpreter='/usr/bin/env python3',
+            main='jirosso:cli',
+        )
+
+
 setup(
     name='jirosso',
     version='1.0',
     author='chexex',
     autho_email='levisolympus@gmail.com',
-    py_modules=['jirosso'],
+    packages=find_packages(exclude=['tests']),
+    package_data={'jirosso': ['settings.ini']},
     include_package_data=True,
+    python_requires='>=3.8',
     install_requires=[
-        'click',
+        'click~=7.0',
         'jira',
     ],
     entry_points='''
         [console_scripts]
         jirosso=jirosso:cli
     ''',
+    cmdclass={
+        'zipapp': BuildZipapp,
+    },
 )
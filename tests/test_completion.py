@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+import pytest
+from click._bashcomplete import get_choices
+
+from jirosso import cli
+from jirosso.client import JiraHelper
+
+
+PROJECTS = ['ZED', 'ABC', 'XAB', 'ABD']
+
+
+@pytest.fixture
+def fetches(monkeypatch, tmp_path):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setenv('JIRA_SERVER', 'https://jira.example.com')
+    monkeypatch.setenv('JIRA_USERNAME', 'user')
+    monkeypatch.setenv('JIRA_PASSWORD', 'password')
+    fetches = []
+
+    def connect(self):
+        fetches.append(self.config['jira_server'])
+        return SimpleNamespace(projects=lambda: [SimpleNamespace(key=k) for k in PROJECTS])
+
+    monkeypatch.setattr(JiraHelper, 'connect', connect)
+    return fetches
+
+
+def complete(incomplete):
+    choices = get_choices(cli, 'jirosso', ['create-issue', '--project'], incomplete)
+    return [choice for choice, _ in choices]
+
+
+def test_complete_project(fetches):
+    assert complete('AB') == ['ABC', 'ABD']
+    assert complete('ZE') == ['ZED']
+    assert complete('XA') == ['XAB']
+    assert fetches == ['https://jira.example.com']
+
+
+def test_complete_project_without_password(fetches, monkeypatch):
+    monkeypatch.delenv('JIRA_PASSWORD')
+    assert complete('AB') == []
+    assert fetches == []
+
+
+def test_complete_project_from_cache(fetches):
+    assert complete('AB') == ['ABC', 'ABD']
+    assert complete('AB') == ['ABC', 'ABD']
+    assert complete('XA') == ['XAB']
+    assert complete('A') == ['ABC', 'ABD']
+    assert len(fetches) == 1
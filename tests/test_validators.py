@@ -0,0 +1,30 @@
+import pytest
+
+from jirosso.cli import ISSUE_RE, is_valid_time
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('30m', True),
+    ('2h', True),
+    ('1d', True),
+    ('12w', True),
+    ('', False),
+    ('m', False),
+    ('2', False),
+    ('2x', False),
+    ('2hh', False),
+    ('h2', False),
+    ('1.5h', False),
+])
+def test_is_valid_time(value, expected):
+    assert is_valid_time(value) is expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('FOO-12', True),
+    ('foo-1', True),
+    ('FOO-12abc', False),
+    ('FOO', False),
+])
+def test_issue_re(value, expected):
+    assert bool(ISSUE_RE.fullmatch(value)) is expected